@@ -121,8 +121,8 @@ export class APIDocumentationWorkflow {
   createInitialState(): WorkflowState {
     const startTime = Date.now();
 
-    // Create output directories
-    fs.ensureDirSync(this.outputDir);
+    // Create output directories; ensureDirSync creates missing parents, so
+    // the subdirectories cover the output directory itself
     fs.ensureDirSync(path.join(this.outputDir, 'markdown'));
     fs.ensureDirSync(path.join(this.outputDir, 'specs'));
 
@@ -3,63 +3,176 @@
  */
 
 import axios from 'axios';
+import * as crypto from 'crypto';
 import * as fs from 'fs-extra';
+import * as http from 'http';
+import * as https from 'https';
 import * as path from 'path';
 import { WorkflowState, CrawlResult } from '../types/workflow-state';
 import { console } from '../utils/console';
 import { Progress } from '../utils/progress';
+import { BatchWriter } from '../utils/batch-writer';
+import { warmTokenCache } from '../utils/token-cache';
+
+const DEFAULT_MAX_CONCURRENCY = 5;
+
+// How long a cached crawl stays fresh before the URL is re-fetched
+const DEFAULT_CACHE_TTL_MS = 24 * 60 * 60 * 1000;
+
+// One connection-pooled client for the whole batch: keep-alive amortizes
+// the TCP+TLS handshake across every request to the same host
+const httpClient = axios.create({
+  timeout: 30000,
+  headers: {
+    'User-Agent': 'API-Doc-Processor/1.0'
+  },
+  httpAgent: new http.Agent({ keepAlive: true, maxSockets: 20 }),
+  httpsAgent: new https.Agent({ keepAlive: true, maxSockets: 20 })
+});
+
+interface CrawlOutcome {
+  result: CrawlResult;
+  markdown?: string;
+}
 
 export async function crawlingNode(state: WorkflowState): Promise<WorkflowState> {
   console.print('\n[bold]Step 2: Crawling URLs...[/bold]');
-  
+
   if (state.urls.length === 0) {
     console.warn('No URLs to crawl');
     return state;
   }
-  
+
   const progress = new Progress();
   const newState = { ...state };
   const markdownDir = path.join(state.output_dir, 'markdown');
-  
+
   // Ensure markdown directory exists
   await fs.ensureDir(markdownDir);
-  
+
+  // One directory enumeration replaces a per-URL existence probe in the
+  // cache lookups below
+  const existingFiles = new Set(await fs.readdir(markdownDir));
+
   let successfulCrawls = 0;
   let failedCrawls = 0;
-  
-  for (const url of state.urls) {
-    const taskId = progress.addTask(`Crawling ${url}`);
-    
-    try {
-      const result = await crawlUrl(url, markdownDir);
-      newState.crawl_results[url] = result;
-      
-      if (result.success && result.filepath) {
-        newState.markdown_files.push(result.filepath);
-        successfulCrawls++;
-        progress.completeTask(taskId, `Crawled ${url} successfully`);
-      } else {
+
+  const crawlParams = state.config.workflow?.crawling?.custom_params;
+
+  // Crawls are independent network round-trips, so dispatch them through a
+  // bounded worker pool instead of awaiting each URL in sequence
+  const maxConcurrency = Math.max(
+    1,
+    crawlParams?.max_concurrency ?? DEFAULT_MAX_CONCURRENCY
+  );
+
+  const forceRefresh = crawlParams?.force_refresh === true;
+  const cacheTtlMs = crawlParams?.cache_ttl_ms ?? DEFAULT_CACHE_TTL_MS;
+
+  // Buffer markdown writes off the crawl path and flush them as one batch
+  const writer = new BatchWriter();
+
+  // Token estimation overlaps the remaining crawls instead of running as a
+  // separate pass in the LLM step; by then the estimates are already warm
+  const tokenWarmups: Promise<void>[] = [];
+
+  // Per-URL result lines for the grouped render, built in the same pass
+  // that records the results (keyed by URL so late write failures can
+  // overwrite their line)
+  const resultLines = new Map<string, string>();
+
+  let nextUrlIndex = 0;
+
+  async function crawlWorker(): Promise<void> {
+    while (nextUrlIndex < state.urls.length) {
+      const url = state.urls[nextUrlIndex++];
+
+      try {
+        // Serve from the on-disk crawl cache when a fresh copy exists
+        if (!forceRefresh) {
+          const cached = await loadCachedCrawl(url, markdownDir, cacheTtlMs, existingFiles);
+          if (cached && cached.filepath) {
+            newState.crawl_results[url] = cached;
+            newState.markdown_files.push(cached.filepath);
+            successfulCrawls++;
+            resultLines.set(url, `[green]✓[/green] Crawled ${url} successfully (cached)`);
+            continue;
+          }
+        }
+
+        const { result, markdown } = await crawlUrl(url, markdownDir);
+        newState.crawl_results[url] = result;
+
+        if (result.success && result.filepath && markdown !== undefined) {
+          writer.add(result.filepath, markdown);
+          writer.add(metaFilepath(result.filepath), JSON.stringify({ url, ts: Date.now() }));
+          tokenWarmups.push(
+            warmTokenCache(
+              result.filepath,
+              markdown,
+              state.config.litellm.model,
+              state.output_dir
+            )
+          );
+          newState.markdown_files.push(result.filepath);
+          successfulCrawls++;
+          resultLines.set(url, `[green]✓[/green] Crawled ${url} successfully`);
+        } else {
+          failedCrawls++;
+          resultLines.set(url, `[red]✗[/red] Failed to crawl ${url}: ${result.error}`);
+        }
+
+      } catch (error) {
+        const errorMsg = `Crawling ${url} failed: ${error}`;
+        newState.crawl_results[url] = {
+          success: false,
+          content_length: 0,
+          error: errorMsg,
+          url
+        };
         failedCrawls++;
-        progress.failTask(taskId, `Failed to crawl ${url}: ${result.error}`);
+        resultLines.set(url, `[red]✗[/red] ${errorMsg}`);
       }
-      
-    } catch (error) {
-      const errorMsg = `Crawling ${url} failed: ${error}`;
-      newState.crawl_results[url] = {
-        success: false,
-        content_length: 0,
-        error: errorMsg,
-        url
-      };
+    }
+  }
+
+  const crawlTaskId = progress.addTask(`Crawling ${state.urls.length} URL(s)`);
+  const workers = Array.from(
+    { length: Math.min(maxConcurrency, state.urls.length) },
+    () => crawlWorker()
+  );
+  await Promise.all(workers);
+  progress.completeTask(crawlTaskId, `Crawled ${state.urls.length} URL(s)`);
+
+  // Flush the buffered markdown writes; demote any crawl whose write failed
+  const failedWrites = await writer.flush();
+  for (const failure of failedWrites) {
+    const result = Object.values(newState.crawl_results).find(
+      r => r.filepath === failure.filepath
+    );
+    if (result) {
+      result.success = false;
+      result.error = `Failed to write markdown: ${failure.error}`;
+      successfulCrawls--;
       failedCrawls++;
-      progress.failTask(taskId, errorMsg);
+      resultLines.set(result.url, `[red]✗[/red] Failed to crawl ${result.url}: ${result.error}`);
     }
+    newState.markdown_files = newState.markdown_files.filter(
+      f => f !== failure.filepath
+    );
+    console.warn(`Failed to write ${failure.filepath}: ${failure.error}`);
   }
-  
+
+  // Warmups are best-effort; estimation falls back to reading from disk
+  await Promise.allSettled(tokenWarmups);
+
   // Update metadata
   newState.metadata.successful_crawls = successfulCrawls;
   newState.metadata.failed_crawls = failedCrawls;
-  
+
+  // One grouped write for the lines accumulated during the crawl
+  console.printGroup([...resultLines.values()]);
+
   console.print(`\n[bold]Crawling Summary:[/bold]`);
   console.print(`[green]✓[/green] Successful: ${successfulCrawls}`);
   console.print(`[red]✗[/red] Failed: ${failedCrawls}`);
@@ -67,50 +180,49 @@ export async function crawlingNode(state: WorkflowState): Promise<WorkflowState>
   return newState;
 }
 
-async function crawlUrl(url: string, outputDir: string): Promise<CrawlResult> {
+async function crawlUrl(url: string, outputDir: string): Promise<CrawlOutcome> {
   try {
     // Simulate Firecrawl API behavior for now
     // In production, this would integrate with actual Firecrawl API
-    const response = await axios.get(url, {
-      timeout: 30000,
-      headers: {
-        'User-Agent': 'API-Doc-Processor/1.0'
-      }
-    });
-    
+    const response = await httpClient.get(url);
+
     if (response.status !== 200) {
       return {
-        success: false,
-        content_length: 0,
-        error: `HTTP ${response.status}: ${response.statusText}`,
-        url
+        result: {
+          success: false,
+          content_length: 0,
+          error: `HTTP ${response.status}: ${response.statusText}`,
+          url
+        }
       };
     }
-    
+
     // Convert HTML to markdown (simplified)
     const content = response.data;
     const markdown = convertHtmlToMarkdown(content);
-    
-    // Generate filename from URL
+
+    // Generate filename from URL; the caller batches the actual write
     const filename = generateFilename(url);
     const filepath = path.join(outputDir, filename);
-    
-    // Write to file
-    await fs.writeFile(filepath, markdown, 'utf-8');
-    
+
     return {
-      success: true,
-      filepath,
-      content_length: markdown.length,
-      url
+      result: {
+        success: true,
+        filepath,
+        content_length: markdown.length,
+        url
+      },
+      markdown
     };
-    
+
   } catch (error: any) {
     return {
-      success: false,
-      content_length: 0,
-      error: error.message || 'Unknown error',
-      url
+      result: {
+        success: false,
+        content_length: 0,
+        error: error.message || 'Unknown error',
+        url
+      }
     };
   }
 }
@@ -132,8 +244,47 @@ function convertHtmlToMarkdown(html: string): string {
 function generateFilename(url: string): string {
   const urlObj = new URL(url);
   const domain = urlObj.hostname.replace(/[^a-zA-Z0-9]/g, '_');
-  const path = urlObj.pathname.replace(/[^a-zA-Z0-9]/g, '_');
-  const timestamp = Date.now();
-  
-  return `${domain}_${path}_${timestamp}.md`;
+  const pathPart = urlObj.pathname.replace(/[^a-zA-Z0-9]/g, '_');
+  const hash = crypto.createHash('sha1').update(url).digest('hex').slice(0, 10);
+
+  // Deterministic per URL so warm runs can locate the cached crawl
+  return `${domain}_${pathPart}_${hash}.md`;
+}
+
+function metaFilepath(filepath: string): string {
+  return `${filepath}.meta.json`;
+}
+
+async function loadCachedCrawl(
+  url: string,
+  outputDir: string,
+  ttlMs: number,
+  existingFiles: Set<string>
+): Promise<CrawlResult | null> {
+  const filename = generateFilename(url);
+  const filepath = path.join(outputDir, filename);
+
+  // Membership in the pre-enumerated directory listing replaces two
+  // filesystem probes per URL
+  if (!existingFiles.has(filename) || !existingFiles.has(`${filename}.meta.json`)) {
+    return null;
+  }
+
+  try {
+    const meta = await fs.readJson(metaFilepath(filepath));
+    if (meta.url !== url || Date.now() - meta.ts > ttlMs) {
+      return null;
+    }
+
+    const stats = await fs.stat(filepath);
+    return {
+      success: true,
+      filepath,
+      content_length: stats.size,
+      url
+    };
+  } catch (error) {
+    // Missing or unreadable cache entry - crawl as usual
+    return null;
+  }
 }
\ No newline at end of file
@@ -8,6 +8,16 @@ import { OpenAI } from 'openai';
 import { WorkflowState } from '../types/workflow-state';
 import { console } from '../utils/console';
 import { Progress } from '../utils/progress';
+import { estimateTokenUsage } from '../utils/token-cache';
+
+// How much of the generated spec to show inline after generation
+const SPEC_PREVIEW_CHARS = 500;
+
+// Streaming progress is reported at coarse intervals to avoid log spam
+const PROGRESS_REPORT_INTERVAL_CHARS = 10000;
+
+// Fallback input-token budget when the config does not set one
+const DEFAULT_MAX_INPUT_TOKENS = 100000;
 
 export async function llmProcessingNode(state: WorkflowState): Promise<WorkflowState> {
   console.print('\n[bold]Step 3: LLM Processing...[/bold]');
@@ -23,13 +33,47 @@ export async function llmProcessingNode(state: WorkflowState): Promise<WorkflowS
   try {
     // Read all markdown files
     const taskId = progress.addTask('Reading markdown files');
-    const markdownContent = await readMarkdownFiles(state.markdown_files);
+    let markdownContent = await readMarkdownFiles(state.markdown_files);
     progress.completeTask(taskId, `Read ${state.markdown_files.length} markdown files`);
-    
-    // Generate technical specification
+
+    // Gate the monolithic LLM call on the token estimate: a request that
+    // cannot fit the context window would fail only after a full round-trip
+    const estimatedInputTokens = await estimateTokenUsage(
+      state.markdown_files,
+      state.config.litellm.model,
+      state.output_dir
+    );
+    const maxInputTokens = state.config.litellm.max_input_tokens || DEFAULT_MAX_INPUT_TOKENS;
+
+    if (estimatedInputTokens > maxInputTokens) {
+      console.warn(
+        `Estimated input (~${estimatedInputTokens} tokens) exceeds the ` +
+        `${maxInputTokens}-token budget; summarizing each file first`
+      );
+      const summarizeTaskId = progress.addTask('Summarizing markdown files to fit the context window');
+      markdownContent = await summarizeMarkdownFiles(state.markdown_files, state.config);
+      progress.completeTask(summarizeTaskId, `Summarized ${state.markdown_files.length} markdown files`);
+    }
+
+    // Generate technical specification, streaming so progress is visible
+    // while the response arrives instead of only after the full round-trip
     const specTaskId = progress.addTask('Generating technical specification with AI');
-    const techSpec = await generateTechSpec(markdownContent, state.config);
+    let lastReportedChars = 0;
+    const techSpec = await generateTechSpec(markdownContent, state.config, chars => {
+      if (chars - lastReportedChars >= PROGRESS_REPORT_INTERVAL_CHARS) {
+        lastReportedChars = chars;
+        progress.updateTask(specTaskId, `Generating technical specification with AI (${chars} chars)`);
+      }
+    });
     progress.completeTask(specTaskId, 'Technical specification generated');
+
+    // Show the head of the spec without copying the full string around
+    console.print('\n[bold]Specification preview:[/bold]');
+    console.print(
+      techSpec.length > SPEC_PREVIEW_CHARS
+        ? `${techSpec.slice(0, SPEC_PREVIEW_CHARS)}...`
+        : techSpec
+    );
     
     // Save tech spec
     const saveTaskId = progress.addTask('Saving technical specification');
@@ -45,10 +89,10 @@ export async function llmProcessingNode(state: WorkflowState): Promise<WorkflowS
     newState.spec_filepath = specFilepath;
     newState.metadata.spec_generated = true;
     
-    // Estimate tokens (simplified calculation)
+    // Estimate tokens (input was computed above from the cached counts)
     newState.metadata.estimated_tokens = {
-      input: Math.ceil(markdownContent.length / 4), // Rough estimate
-      output: Math.ceil(techSpec.length / 4)
+      input: estimatedInputTokens,
+      output: Math.ceil(techSpec.length / 4) // Rough estimate
     };
     
     console.success('LLM processing completed successfully');
@@ -78,7 +122,67 @@ async function readMarkdownFiles(filePaths: string[]): Promise<string> {
   return contents.join('\n');
 }
 
-async function generateTechSpec(content: string, config: any): Promise<string> {
+async function summarizeMarkdownFiles(filePaths: string[], config: any): Promise<string> {
+  const summaries: string[] = [];
+
+  for (const filePath of filePaths) {
+    try {
+      const content = await fs.readFile(filePath, 'utf-8');
+      const summary = await summarizeContent(content, config);
+      summaries.push(`\n\n## Summary of ${path.basename(filePath)}\n\n${summary}`);
+    } catch (error) {
+      console.warn(`Failed to summarize ${filePath}: ${error}`);
+    }
+  }
+
+  return summaries.join('\n');
+}
+
+async function summarizeContent(content: string, config: any): Promise<string> {
+  const prompt = `
+Summarize the following API documentation page. Preserve every endpoint,
+HTTP method, parameter, schema, error code and authentication detail needed
+to reconstruct the API surface; omit prose that does not describe the API.
+
+${content}
+  `.trim();
+
+  try {
+    const openai = new OpenAI({
+      apiKey: config.litellm.api_key,
+      baseURL: config.litellm.base_url
+    });
+
+    const response = await openai.chat.completions.create({
+      model: config.litellm.model,
+      messages: [
+        {
+          role: 'user',
+          content: prompt
+        }
+      ],
+      max_tokens: config.litellm.max_tokens,
+      temperature: 0.3
+    });
+
+    const summary = response.choices[0]?.message?.content;
+
+    if (!summary) {
+      throw new Error('No response from LLM');
+    }
+
+    return summary;
+
+  } catch (error: any) {
+    throw new Error(`LLM API request failed: ${error.message}`);
+  }
+}
+
+async function generateTechSpec(
+  content: string,
+  config: any,
+  onProgress?: (chars: number) => void
+): Promise<string> {
   const prompt = `
 Analyze the following API documentation content and create a comprehensive technical specification.
 
@@ -103,7 +207,7 @@ Generate a detailed technical specification in markdown format that can be used
       baseURL: config.litellm.base_url
     });
 
-    const response = await openai.chat.completions.create({
+    const stream = await openai.chat.completions.create({
       model: config.litellm.model,
       messages: [
         {
@@ -112,16 +216,30 @@ Generate a detailed technical specification in markdown format that can be used
         }
       ],
       max_tokens: config.litellm.max_tokens,
-      temperature: 0.7
+      temperature: 0.7,
+      stream: true
     });
 
-    const techSpec = response.choices[0]?.message?.content;
-    
-    if (!techSpec) {
+    // Collect chunks and join once at the end to avoid quadratic concat
+    const chunks: string[] = [];
+    let totalChars = 0;
+
+    for await (const part of stream) {
+      const delta = part.choices[0]?.delta?.content;
+      if (delta) {
+        chunks.push(delta);
+        totalChars += delta.length;
+        if (onProgress) {
+          onProgress(totalChars);
+        }
+      }
+    }
+
+    if (chunks.length === 0) {
       throw new Error('No response from LLM');
     }
-    
-    return techSpec;
+
+    return chunks.join('');
     
   } catch (error: any) {
     throw new Error(`LLM API request failed: ${error.message}`);
@@ -5,7 +5,7 @@
 import * as readlineSync from 'readline-sync';
 import { WorkflowState } from '../types/workflow-state';
 import { console } from '../utils/console';
-import { validateUrl, deduplicateUrls, validateUrlsBatch } from '../utils/validation';
+import { validateUrl, deduplicateUrls } from '../utils/validation';
 
 export async function urlCollectionNode(state: WorkflowState): Promise<WorkflowState> {
   console.print('[bold]Enter API documentation URLs[/bold]');
@@ -33,20 +33,10 @@ export async function urlCollectionNode(state: WorkflowState): Promise<WorkflowS
       console.print(`[green]✓[/green] Added: ${url}`);
     }
     
-    // Remove duplicates while preserving order
-    const deduplicatedUrls = deduplicateUrls(urls);
-    
-    // Final validation
-    const { validUrls, invalidUrls } = validateUrlsBatch(deduplicatedUrls);
-    
-    if (invalidUrls.length > 0) {
-      console.print('\n[yellow]Warning: Some URLs failed validation:[/yellow]');
-      for (const { url, error } of invalidUrls) {
-        console.print(`  [red]✗[/red] ${url}: ${error}`);
-        state.warnings.push(`URL validation warning: ${url} - ${error}`);
-      }
-    }
-    
+    // Remove duplicates while preserving order; every URL in the list
+    // already passed validateUrl on entry, so no second validation pass
+    const validUrls = deduplicateUrls(urls);
+
     // Update state
     const newState = { ...state };
     newState.urls = validUrls;
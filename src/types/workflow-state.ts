@@ -46,6 +46,7 @@ export interface Config {
     model: string;
     api_key: string;
     max_tokens: number;
+    max_input_tokens?: number;
     base_url?: string;
     custom_headers?: Record<string, string>;
   };
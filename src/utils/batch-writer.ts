@@ -0,0 +1,57 @@
+/**
+ * Batched file writer - buffers writes off the hot path and flushes
+ * them together in one step
+ */
+
+import * as fs from 'fs-extra';
+
+// Below this many pending writes, a plain sequential loop beats paying the
+// scheduling overhead of a concurrent flush (N=1 is a realistic crawl size)
+const BATCH_FLUSH_THRESHOLD = 4;
+
+export interface PendingWrite {
+  filepath: string;
+  content: string;
+}
+
+export interface FailedWrite {
+  filepath: string;
+  error: string;
+}
+
+export class BatchWriter {
+  private pending: PendingWrite[] = [];
+
+  add(filepath: string, content: string): void {
+    this.pending.push({ filepath, content });
+  }
+
+  get size(): number {
+    return this.pending.length;
+  }
+
+  async flush(): Promise<FailedWrite[]> {
+    const writes = this.pending;
+    this.pending = [];
+
+    const failed: FailedWrite[] = [];
+
+    const writeOne = async ({ filepath, content }: PendingWrite): Promise<void> => {
+      try {
+        await fs.writeFile(filepath, content, 'utf-8');
+      } catch (error: any) {
+        failed.push({ filepath, error: error.message || 'Unknown error' });
+      }
+    };
+
+    if (writes.length < BATCH_FLUSH_THRESHOLD) {
+      for (const write of writes) {
+        await writeOne(write);
+      }
+    } else {
+      await Promise.all(writes.map(writeOne));
+    }
+
+    return failed;
+  }
+}
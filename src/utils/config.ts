@@ -46,6 +46,7 @@ function validateAndParseConfig(configData: any): Config {
       api_key: configData.litellm.api_key,
       model: configData.litellm.model || 'gpt-3.5-turbo',
       max_tokens: configData.litellm.max_tokens || 4000,
+      max_input_tokens: configData.litellm.max_input_tokens || 100000,
       base_url: configData.litellm.base_url,
       custom_headers: configData.litellm.custom_headers
     },
@@ -32,6 +32,15 @@ export class Console {
       .replace(/\[magenta\](.*?)\[\/magenta\]/g, chalk.magenta('$1'));
   }
 
+  printGroup(lines: string[]): void {
+    if (lines.length === 0) {
+      return;
+    }
+    // One formatter pass and one stdout write for the whole group
+    const parsed = lines.map(line => this.parseRichMarkup(line));
+    process.stdout.write(parsed.join('\n') + '\n');
+  }
+
   error(message: string): void {
     this.print(`[red]Error:[/red] ${message}`);
   }
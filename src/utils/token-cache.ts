@@ -0,0 +1,128 @@
+/**
+ * Token estimation cache - keyed by model + content hash so repeated runs
+ * over identical crawl output skip re-estimation entirely
+ */
+
+import * as crypto from 'crypto';
+import * as fs from 'fs-extra';
+import * as path from 'path';
+
+const CACHE_FILENAME = '.token_cache.json';
+
+// In-process view of each cache file, keyed by its location on disk
+const loadedCaches = new Map<string, Record<string, number>>();
+
+// Estimates computed while file content was still in memory (e.g. during
+// the crawl), keyed by destination path so later passes skip disk I/O
+const warmEstimates = new Map<string, number>();
+
+async function loadCache(outputDir: string): Promise<Record<string, number>> {
+  const cachePath = path.join(outputDir, CACHE_FILENAME);
+
+  let cache = loadedCaches.get(cachePath);
+  if (!cache) {
+    try {
+      cache = await fs.readJson(cachePath);
+    } catch (error) {
+      // Missing or corrupt cache file - start fresh
+      cache = {};
+    }
+    loadedCaches.set(cachePath, cache!);
+  }
+
+  return cache!;
+}
+
+async function persistCache(outputDir: string): Promise<void> {
+  const cachePath = path.join(outputDir, CACHE_FILENAME);
+  const cache = loadedCaches.get(cachePath);
+
+  if (cache) {
+    try {
+      await fs.writeJson(cachePath, cache);
+    } catch (error) {
+      // Cache persistence is best-effort; estimation still works without it
+    }
+  }
+}
+
+function estimateTokens(byteLength: number): number {
+  return Math.ceil(byteLength / 4); // Rough estimate (~4 chars per token)
+}
+
+function hashFile(filepath: string): Promise<string> {
+  return new Promise((resolve, reject) => {
+    const hash = crypto.createHash('sha256');
+    const stream = fs.createReadStream(filepath);
+
+    stream.on('error', reject);
+    stream.on('data', chunk => hash.update(chunk));
+    stream.on('end', () => resolve(hash.digest('hex')));
+  });
+}
+
+export async function warmTokenCache(
+  filepath: string,
+  content: string,
+  model: string,
+  outputDir: string
+): Promise<void> {
+  const cache = await loadCache(outputDir);
+
+  const buffer = Buffer.from(content, 'utf-8');
+  const hash = crypto.createHash('sha256').update(buffer).digest('hex');
+  const key = `${model}:${hash}`;
+
+  if (!(key in cache)) {
+    cache[key] = estimateTokens(buffer.length);
+  }
+  warmEstimates.set(filepath, cache[key]);
+}
+
+export async function estimateFileTokens(
+  filepath: string,
+  model: string,
+  outputDir: string
+): Promise<number> {
+  const warm = warmEstimates.get(filepath);
+  if (warm !== undefined) {
+    return warm;
+  }
+
+  const cache = await loadCache(outputDir);
+
+  // Hash from a stream and estimate from the file size, so the file is
+  // never buffered in memory in full
+  const [hash, stats] = await Promise.all([
+    hashFile(filepath),
+    fs.stat(filepath)
+  ]);
+  const key = `${model}:${hash}`;
+
+  if (key in cache) {
+    return cache[key];
+  }
+
+  const tokens = estimateTokens(stats.size);
+  cache[key] = tokens;
+  return tokens;
+}
+
+export async function estimateTokenUsage(
+  filepaths: string[],
+  model: string,
+  outputDir: string
+): Promise<number> {
+  let total = 0;
+
+  for (const filepath of filepaths) {
+    try {
+      total += await estimateFileTokens(filepath, model, outputDir);
+    } catch (error) {
+      // Unreadable files are skipped, matching readMarkdownFiles behavior
+    }
+  }
+
+  await persistCache(outputDir);
+  return total;
+}
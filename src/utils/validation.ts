@@ -4,6 +4,10 @@
 
 import { URL } from 'url';
 
+// Compiled once at module load; cheap prescreen for the hot validator so
+// obviously invalid input never reaches the throw/catch of the URL parser
+const HTTP_URL_PREFIX_RE = /^https?:\/\//i;
+
 export interface ValidationResult {
   isValid: boolean;
   error?: string;
@@ -14,9 +18,14 @@ export function validateUrl(urlString: string): ValidationResult {
     return { isValid: false, error: 'Empty URL' };
   }
 
+  // Fast path: reject non-http(s) input without paying for a failed parse
+  if (!HTTP_URL_PREFIX_RE.test(urlString.trim())) {
+    return { isValid: false, error: 'URL must use HTTP or HTTPS protocol' };
+  }
+
   try {
     const url = new URL(urlString.trim());
-    
+
     // Check if protocol is HTTP or HTTPS
     if (!['http:', 'https:'].includes(url.protocol)) {
       return { isValid: false, error: 'URL must use HTTP or HTTPS protocol' };
@@ -33,18 +42,37 @@ export function validateUrl(urlString: string): ValidationResult {
   }
 }
 
+function normalizeUrl(urlString: string): string {
+  const trimmed = urlString.trim();
+
+  try {
+    // URL lowercases the scheme and hostname for us; additionally drop the
+    // fragment and a bare trailing slash so e.g. http://X/ and http://x/#a
+    // collapse to the same key
+    const url = new URL(trimmed);
+    url.hash = '';
+    let normalized = url.toString();
+    if (url.pathname === '/' && !url.search) {
+      normalized = normalized.replace(/\/$/, '');
+    }
+    return normalized;
+  } catch (error) {
+    return trimmed.toLowerCase();
+  }
+}
+
 export function deduplicateUrls(urls: string[]): string[] {
   const seen = new Set<string>();
   const result: string[] = [];
-  
+
   for (const url of urls) {
-    const normalized = url.trim().toLowerCase();
+    const normalized = normalizeUrl(url);
     if (!seen.has(normalized)) {
       seen.add(normalized);
       result.push(url.trim());
     }
   }
-  
+
   return result;
 }
 